@@ -6,6 +6,8 @@ class Device_Category(object):
     END_DEVICE = 2
 
 class Device(object):
+    __slots__ = ("name", "id", "category", "address", "joined")
+
     def __init__(self, name, id, category):
         self.name = name
         self.id = id
@@ -13,6 +15,100 @@ class Device(object):
         self.address = "-"
         self.joined = False
 
+class Device_Model(QtCore.QAbstractItemModel):
+    """
+    Item model for a tree of devices and their properties.
+
+    The top level rows are the devices, and each device has child rows for
+    its properties. The model wraps the list of `Device` objects directly,
+    so that changes to these objects only need to be signaled to the views.
+    """
+
+    CATEGORY_NAMES = {
+        Device_Category.COORDINATOR: "Coordinator",
+        Device_Category.END_DEVICE: "End device"
+    }
+    HEADERS = ["Device", "Property value"]
+    PROPERTIES = ["ID", "Category", "Address", "Joined"]
+
+    def __init__(self, devices, parent=None):
+        super(Device_Model, self).__init__(parent)
+
+        self._devices = devices
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QtCore.QModelIndex()
+
+        # The internal ID of an index is zero for a device row, or one more 
+        # than the row of the device for a property row.
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QtCore.QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            return len(self._devices)
+
+        if parent.internalId() == 0 and parent.column() == 0:
+            return len(self.PROPERTIES)
+
+        return 0
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid() or role != QtCore.Qt.DisplayRole:
+            return QtCore.QVariant()
+
+        if index.internalId() == 0:
+            if index.column() == 0:
+                return self._devices[index.row()].name
+
+            return QtCore.QVariant()
+
+        if index.column() == 0:
+            return self.PROPERTIES[index.row()]
+
+        device = self._devices[index.internalId() - 1]
+        return self._get_property(device, index.row())
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+
+        return QtCore.QVariant()
+
+    def _get_property(self, device, row):
+        if row == 0:
+            return str(device.id)
+        if row == 1:
+            return self.CATEGORY_NAMES[device.category]
+        if row == 2:
+            return device.address
+
+        return "Yes" if device.joined else "No"
+
+    def update(self):
+        """
+        Signal that the properties of the devices may have changed.
+        """
+
+        # Only the address and joined properties may change after a device 
+        # is created.
+        for row in xrange(len(self._devices)):
+            parent = self.index(row, 0)
+            self.dataChanged.emit(self.index(2, 1, parent),
+                                  self.index(3, 1, parent))
+
 class Control_Panel_Devices_View(Control_Panel_View):
     def __init__(self, controller, settings):
         super(Control_Panel_Devices_View, self).__init__(controller, settings)
@@ -21,6 +117,7 @@ class Control_Panel_Devices_View(Control_Panel_View):
         self._timer = None
         self._discover_interval = self._settings.get("devices_discover_delay")
         self._tree_view = None
+        self._model = None
         self._devices = []
 
     def load(self, data):
@@ -48,14 +145,17 @@ class Control_Panel_Devices_View(Control_Panel_View):
 
         self._add_menu_bar()
 
-        # Create the tree view.
-        self._tree_view = QtGui.QTreeWidget()
-
-        # Create the header for the tree view.
-        header = QtGui.QTreeWidgetItem(["Device", "Property value"])
-        self._tree_view.setHeaderItem(header)
+        # Create the tree view with a model for the devices.
+        self._model = Device_Model(self._devices)
+        self._tree_view = QtGui.QTreeView()
+        self._tree_view.setModel(self._model)
+        self._tree_view.setUniformRowHeights(True)
+        self._tree_view.setAnimated(False)
         self._tree_view.header().setResizeMode(0, QtGui.QHeaderView.Stretch)
 
+        # Expand all items in the tree view.
+        self._tree_view.expandToDepth(0)
+
         # Refresh immediately to fill the tree view with the devices and to 
         # discover any vehicles that are already connected.
         self._refresh()
@@ -78,26 +178,12 @@ class Control_Panel_Devices_View(Control_Panel_View):
         if self._timer is not None:
             self._timer.stop()
 
-    def _fill(self):
+    def _update(self):
         """
-        Fill the tree view with the device information.
+        Update the tree view with the current device information.
         """
 
-        categories = {
-            Device_Category.COORDINATOR: "Coordinator",
-            Device_Category.END_DEVICE: "End device"
-        }
-
-        # Add an entry in the tree view for each device.
-        for device in self._devices:
-            item = QtGui.QTreeWidgetItem(self._tree_view, [device.name])
-            item.addChild(QtGui.QTreeWidgetItem(["ID", str(device.id)]))
-            item.addChild(QtGui.QTreeWidgetItem(["Category", categories[device.category]]))
-            item.addChild(QtGui.QTreeWidgetItem(["Address", device.address]))
-            item.addChild(QtGui.QTreeWidgetItem(["Joined", "Yes" if device.joined else "No"]))
-
-        # Expand all items in the tree view.
-        self._tree_view.expandToDepth(0)
+        self._model.update()
 
     def _refresh(self):
         """
@@ -118,8 +204,7 @@ class Control_Panel_Devices_View(Control_Panel_View):
         ground_station.address = identity["address"]
         ground_station.joined = identity["joined"]
 
-        self._tree_view.clear()
-        self._fill()
+        self._update()
 
     def _check_discover(self):
         """
@@ -127,8 +212,7 @@ class Control_Panel_Devices_View(Control_Panel_View):
         """
 
         if self._updated:
-            self._tree_view.clear()
-            self._fill()
+            self._update()
             self._updated = False
 
             # Once all devices are discovered, then we do not need to wait for 
@@ -15,6 +15,8 @@ class Control_Panel_RF_Sensor_Sender(object):
         self._add_callback = configuration["add_callback"]
         self._done_message = configuration["done_message"]
         self._ack_message = configuration["ack_message"]
+        # Optional callback that describes the data in the progress label.
+        self._label_callback = configuration.get("label_callback")
 
         self._max_retries = configuration["max_retries"]
         self._retry_interval = configuration["retry_interval"]
@@ -110,6 +112,9 @@ class Control_Panel_RF_Sensor_Sender(object):
 
         self._controller.rf_sensor.enqueue(packet, to=vehicle)
 
+        if self._label_callback is not None:
+            data = self._label_callback(data)
+
         self._set_label(vehicle, "Sending {} #{}: {}".format(self._name, index+1, data))
 
         if vehicle in self._timers:
@@ -1,5 +1,6 @@
 import json
-from PyQt4 import QtGui
+import zlib
+from PyQt4 import QtCore, QtGui
 from Control_Panel_RF_Sensor_Sender import Control_Panel_RF_Sensor_Sender
 from Control_Panel_View import Control_Panel_View, Control_Panel_View_Name
 from Control_Panel_Widgets import QLineEditClear
@@ -13,27 +14,94 @@ class Setting_Filter_Match(object):
     HELP = 2
     VALUE = 3
 
+class Settings_File_Writer(QtCore.QThread):
+    """
+    Thread that writes serialized settings to a settings file, so that the
+    GUI thread is not blocked while writing.
+
+    The `written` signal is emitted with a boolean indicating whether the file
+    was written successfully and an error message if it was not.
+    """
+
+    written = QtCore.pyqtSignal(bool, str, name='written')
+
+    def __init__(self, file_name, payload, parent=None):
+        super(Settings_File_Writer, self).__init__(parent)
+
+        self._file_name = file_name
+        self._payload = payload
+
+    def run(self):
+        try:
+            with open(self._file_name, 'w') as json_file:
+                json_file.write(self._payload)
+        except IOError as e:
+            message = "Could not write settings file '{}': {}".format(self._file_name, e.strerror)
+            self.written.emit(False, message)
+        else:
+            self.written.emit(True, "")
+
 class Control_Panel_Settings_View(Control_Panel_View):
+    # Maximum number of bytes that zlib compression adds to data that is
+    # shorter than one stored block.
+    ZLIB_MAX_OVERHEAD = 11
+
+    _components_cache = None
+
+    @classmethod
+    def _get_components(cls):
+        """
+        Retrieve the settings components sorted by their descriptive names,
+        as well as a list of these names in the same order.
+
+        The components are read from the defaults file once and cached in the
+        class, until the cache is cleared when the settings are reloaded.
+        """
+
+        if cls._components_cache is None:
+            defaults = Settings.get_settings(Settings.DEFAULTS_FILE)
+            components = sorted(defaults.iterkeys(),
+                                key=lambda k: defaults[k]["name"])
+            names = [defaults[c]["name"] for c in components]
+            cls._components_cache = (components, names)
+
+        return cls._components_cache
+
     def __init__(self, controller, settings):
         super(Control_Panel_Settings_View, self).__init__(controller, settings)
 
         self._components = []
+        self._containers = []
         self._widgets = []
         self._best_matches = {}
+        self._search_blobs = []
+        self._search_texts = {}
         self._new_settings = {}
+        self._ordered_settings = []
+        self._writer = None
 
-        self._listWidget = None
+        self._listModel = None
+        self._proxyModel = None
+        self._listView = None
         self._stackedLayout = None
 
     def show(self):
         self._add_menu_bar()
 
-        self._listWidget = QtGui.QListWidget()
+        self._listModel = QtGui.QStandardItemModel()
+        self._proxyModel = QtGui.QSortFilterProxyModel()
+        self._proxyModel.setSourceModel(self._listModel)
+        self._proxyModel.setFilterRole(QtCore.Qt.UserRole)
+        self._proxyModel.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+
+        self._listView = QtGui.QListView()
+        self._listView.setModel(self._proxyModel)
+        self._listView.setEditTriggers(QtGui.QAbstractItemView.NoEditTriggers)
         self._stackedLayout = QtGui.QStackedLayout()
 
         # Create the layout and add the widgets.
         hbox_stacks = QtGui.QHBoxLayout()
-        hbox_stacks.addWidget(self._listWidget)
+        hbox_stacks.addWidget(self._listView)
         hbox_stacks.addLayout(self._stackedLayout)
 
         hbox_buttons = QtGui.QHBoxLayout()
@@ -42,35 +110,35 @@ class Control_Panel_Settings_View(Control_Panel_View):
         vbox.addLayout(hbox_stacks)
         vbox.addLayout(hbox_buttons)
 
-        defaults = Settings.get_settings(Settings.DEFAULTS_FILE)
-        self._components = sorted(defaults.iterkeys(),
-                                  key=lambda k: defaults[k]["name"])
+        components, names = self._get_components()
+        self._components = list(components)
 
-        self._listWidget.addItems([defaults[c]["name"] for c in self._components])
-        self._listWidget.setSizePolicy(QtGui.QSizePolicy.Fixed, QtGui.QSizePolicy.Expanding)
-        self._listWidget.setCurrentRow(0)
+        self._search_blobs = [
+            self._make_search_blob(component) for component in self._components
+        ]
 
-        self._widgets = []
-        for component in self._components:
-            container = QtGui.QScrollArea()
-            container.setWidgetResizable(True)
-            self._stackedLayout.addWidget(container)
+        # Each item in the list model holds the search text of its component, 
+        # which the proxy model uses to filter the list.
+        for name, blob in zip(names, self._search_blobs):
+            item = QtGui.QStandardItem(name)
+            item.setData(blob, QtCore.Qt.UserRole)
+            self._listModel.appendRow(item)
 
-            widget = SettingsWidget(self._controller.arguments, component,
-                                    container)
-            widget.parentClicked.connect(self._goto_parent)
-            container.setWidget(widget)
+        self._listView.setSizePolicy(QtGui.QSizePolicy.Fixed, QtGui.QSizePolicy.Expanding)
+        self._set_current_row(0)
 
-            self._widgets.append(widget)
+        # The containers and settings widgets are only created once their 
+        # component is shown for the first time.
+        self._containers = [None] * len(self._components)
+        self._widgets = [None] * len(self._components)
 
-        self._listWidget.currentRowChanged.connect(self._stackedLayout.setCurrentIndex)
-        self._stackedLayout.currentChanged.connect(self._current_changed)
-        self._current_changed(self._stackedLayout.currentIndex())
+        self._listView.selectionModel().currentChanged.connect(self._current_index_changed)
+        self._current_changed(self._get_current_row())
 
         filterInput = QLineEditClear()
         filterInput.setPlaceholderText("Search...")
         filterInput.textChanged.connect(self._filter)
-        filterInput.setFixedWidth(self._listWidget.sizeHint().width())
+        filterInput.setFixedWidth(self._listView.sizeHint().width())
         filterInput.setSizePolicy(QtGui.QSizePolicy.Fixed, QtGui.QSizePolicy.Maximum)
 
         saveButton = QtGui.QPushButton("Save")
@@ -80,12 +148,60 @@ class Control_Panel_Settings_View(Control_Panel_View):
         hbox_buttons.addStretch(1)
         hbox_buttons.addWidget(saveButton)
 
+    def _get_current_row(self):
+        """
+        Retrieve the index of the component that is currently selected in the
+        list view, or `-1` if no component is selected.
+        """
+
+        return self._proxyModel.mapToSource(self._listView.currentIndex()).row()
+
+    def _set_current_row(self, index):
+        """
+        Select the component with the given `index` in the list view.
+        """
+
+        proxy_index = self._proxyModel.mapFromSource(self._listModel.index(index, 0))
+        if proxy_index.isValid():
+            self._listView.setCurrentIndex(proxy_index)
+
+    def _current_index_changed(self, current, previous):
+        self._current_changed(self._proxyModel.mapToSource(current).row())
+
     def _current_changed(self, index):
+        if index < 0:
+            return
+
+        self._get_widget(index)
+        self._stackedLayout.setCurrentWidget(self._containers[index])
         self._scroll_to_match()
 
+    def _get_widget(self, index):
+        """
+        Retrieve the settings widget for the component with the given `index`.
+
+        The container and settings widget are created when they are needed for
+        the first time.
+        """
+
+        if self._widgets[index] is None:
+            container = QtGui.QScrollArea()
+            container.setWidgetResizable(True)
+            self._stackedLayout.addWidget(container)
+
+            widget = SettingsWidget(self._controller.arguments,
+                                    self._components[index], container)
+            widget.parentClicked.connect(self._goto_parent)
+            container.setWidget(widget)
+
+            self._containers[index] = container
+            self._widgets[index] = widget
+
+        return self._widgets[index]
+
     def _goto_parent(self, parent):
         i = self._components.index(parent)
-        self._listWidget.setCurrentRow(i)
+        self._set_current_row(i)
 
     def _format_disallowed(self, disallowed):
         """
@@ -100,21 +216,27 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
         return warnLayout
 
-    def _get_save_check_boxes(self):
+    def _get_save_check_boxes(self, boxLayout):
         """
         Create check boxes for save locations that are shown in the save dialog.
+
+        The check boxes are added to the given layout `boxLayout` in order.
         """
 
         groundCheckBox = QtGui.QCheckBox("Ground station")
         groundCheckBox.setChecked(True)
+        boxLayout.addWidget(groundCheckBox)
+
         vehicleCheckBoxes = {}
         try:
             devices = self._controller.get_view_data(Control_Panel_View_Name.DEVICES, "devices")
         except KeyError:
             devices = []
 
-        for vehicle in xrange(1, self._controller.rf_sensor.number_of_sensors + 1):
-            if vehicle < len(devices):
+        number_of_devices = len(devices)
+        number_of_sensors = self._controller.rf_sensor.number_of_sensors
+        for vehicle in xrange(1, number_of_sensors + 1):
+            if vehicle < number_of_devices:
                 vehicleJoined = devices[vehicle].joined
             else:
                 vehicleJoined = True
@@ -122,6 +244,7 @@ class Control_Panel_Settings_View(Control_Panel_View):
             vehicleCheckBox = QtGui.QCheckBox("Vehicle {}".format(vehicle))
             vehicleCheckBox.setChecked(vehicleJoined)
             vehicleCheckBox.setEnabled(vehicleJoined)
+            boxLayout.addWidget(vehicleCheckBox)
 
             vehicleCheckBoxes[vehicle] = vehicleCheckBox
 
@@ -149,12 +272,8 @@ class Control_Panel_Settings_View(Control_Panel_View):
         scrollWarnings.setWidget(groupWarnings)
 
         # Create check boxes for selecting target save locations.
-        groundCheckBox, vehicleCheckBoxes = self._get_save_check_boxes()
-
         boxLayout = QtGui.QVBoxLayout()
-        boxLayout.addWidget(groundCheckBox)
-        for vehicle in xrange(1, self._controller.rf_sensor.number_of_sensors + 1):
-            boxLayout.addWidget(vehicleCheckBoxes[vehicle])
+        groundCheckBox, vehicleCheckBoxes = self._get_save_check_boxes(boxLayout)
 
         groupBox = QtGui.QGroupBox("Save locations")
         groupBox.setLayout(boxLayout)
@@ -179,18 +298,35 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
         return dialog, groundCheckBox, vehicleCheckBoxes
 
+    def clear(self, layout=None):
+        # Wait for the settings file to be written, so that a running writer 
+        # thread is never destroyed.
+        if self._is_writing():
+            self._writer.wait()
+
+        super(Control_Panel_Settings_View, self).clear(layout)
+
+    def _is_writing(self):
+        return self._writer is not None and self._writer.isRunning()
+
     def _save(self):
         """
         Create the save dialog and handle saving/sending the settings.
         """
 
+        # Ignore saving again while the settings file is still being written.
+        if self._is_writing():
+            return
+
         flat_settings = {}
         disallowed = []
-        for i, widget in enumerate(self._widgets):
-            if widget is not None:
-                values, allowed = widget.get_values()
-                flat_settings.update(values)
-                disallowed.extend([(i, key) for key, value in allowed.iteritems() if not value])
+        for i in range(len(self._components)):
+            # Create the widgets of components that have not been shown yet, 
+            # so that all values are normalized in the same way.
+            widget = self._get_widget(i)
+            values, allowed = widget.get_values()
+            flat_settings.update(values)
+            disallowed.extend([(i, key) for key, value in allowed.iteritems() if not value])
 
         # Create the save dialog.
         dialog, groundCheckBox, vehicleCheckBoxes = self._create_save_dialog(flat_settings, disallowed)
@@ -202,14 +338,16 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
         # Set up the saving or settings sender.
         self._new_settings = flat_settings
+        self._ordered_settings = sorted(self._new_settings.iteritems())
 
         vehicle_settings = {}
-        keys = sorted(self._new_settings.keys())
+        batches = self._get_setting_batches()
         count = 0
-        for vehicle in xrange(1, self._controller.rf_sensor.number_of_sensors + 1):
-            if vehicleCheckBoxes[vehicle].isChecked():
-                vehicle_settings[vehicle] = keys
-                count += len(keys)
+        for vehicle, vehicleCheckBox in vehicleCheckBoxes.iteritems():
+            if vehicleCheckBox.isChecked():
+                # Each vehicle receives its own list of batches.
+                vehicle_settings[vehicle] = list(batches)
+                count += len(batches)
 
         if not vehicle_settings:
             if groundCheckBox.isChecked():
@@ -223,6 +361,7 @@ class Control_Panel_Settings_View(Control_Panel_View):
             "add_callback": self._make_add_setting_packet,
             "done_message": "setting_done",
             "ack_message": "setting_ack",
+            "label_callback": self._format_setting_batch,
             "max_retries": self._settings.get("settings_max_retries"),
             "retry_interval": self._settings.get("settings_retry_interval")
         }
@@ -234,28 +373,134 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
         sender.start()
 
-    def _make_add_setting_packet(self, vehicle, index, key):
+    def _get_setting_batches(self):
+        """
+        Group the ordered settings items into batches that are each sent to
+        a vehicle in a single packet.
+
+        Consecutive settings are added to a batch as long as the serialized
+        packet fits within the packet length of the RF sensor type in use.
+        Settings that do not fit together with others are sent in a batch of
+        their own.
+
+        Returns a list of batches, where each batch is a list of key and value
+        pairs in the sorted order.
+        """
+
+        rf_sensor_type = self._controller.rf_sensor.type
+        rf_sensor_settings = self._controller.arguments.get_settings(rf_sensor_type)
+        packet_length = rf_sensor_settings.get("packet_length")
+        overhead = self._get_bulk_packet_overhead()
+
+        batches = []
+        batch = []
+        size = 0
+        for key, value in self._ordered_settings:
+            # Track the length of the JSON-serialized settings object in the 
+            # packet, including the separator between items, without 
+            # serializing the entire batch again.
+            item_size = len(json.dumps({str(key): value})) - len("{}")
+            if batch and size + len(", ") + item_size > packet_length:
+                batches.append(batch)
+                batch = []
+
+            if batch:
+                size += len(", ") + item_size
+            else:
+                size = overhead + len("{}") + item_size
+
+            batch.append((key, value))
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def _get_bulk_packet_overhead(self):
+        """
+        Determine the number of bytes that a serialized packet with multiple
+        settings takes in addition to the JSON-serialized settings object.
+
+        This includes the other packet fields as well as the maximum number of
+        bytes that compressing the settings object may add for small objects.
+        """
+
         packet = Packet()
-        packet.set("specification", "setting_add")
+        packet.set("specification", "setting_add_bulk")
+        packet.set("settings", {})
+        packet.set("index", 0)
+        packet.set("to_id", 0)
+
+        header_size = len(packet.serialize()) - len(zlib.compress("{}"))
+        return header_size + self.ZLIB_MAX_OVERHEAD
+
+    def _format_setting_batch(self, batch):
+        return ", ".join(key for key, value in batch)
+
+    def _make_add_setting_packet(self, vehicle, index, batch):
+        packet = Packet()
+        if len(batch) == 1:
+            key, value = batch[0]
+            packet.set("specification", "setting_add")
+            packet.set("key", str(key))
+            packet.set("value", value)
+        else:
+            packet.set("specification", "setting_add_bulk")
+            packet.set("settings", dict(
+                (str(key), value) for key, value in batch
+            ))
+
         packet.set("index", index)
-        packet.set("key", str(key))
-        packet.set("value", self._new_settings[key])
         packet.set("to_id", vehicle)
 
         return packet
 
     def _set_ground_station_settings(self):
-        with open(self._controller.arguments.settings_file, 'w') as json_file:
-            json.dump(self._new_settings, json_file, indent=4, sort_keys=True)
+        if self._is_writing():
+            return
+
+        # Serialize the settings on the GUI thread, since they may be altered 
+        # later on, but write them to the file in a separate thread. Once that 
+        # thread is done, we handle the result on the GUI thread. The thread 
+        # is owned by the central widget, which outlives this view.
+        payload = json.dumps(self._new_settings, indent=4, sort_keys=True)
+
+        self._writer = Settings_File_Writer(self._controller.arguments.settings_file,
+                                            payload, self._controller.central_widget)
+        self._writer.written.connect(self._written)
+        self._writer.finished.connect(self._writer_finished)
+        self._writer.start()
+
+    def _writer_finished(self):
+        self._writer.deleteLater()
+        self._writer = None
+
+    def _written(self, success, message):
+        """
+        Handle the result of writing the settings file.
+        """
+
+        if not success:
+            QtGui.QMessageBox.critical(self._controller.central_widget,
+                                       "Settings error", message)
+            return
+
+        self._reload_settings()
+
+    def _reload_settings(self):
+        """
+        Reload the settings after the settings file has been written.
+        """
 
         Settings.settings_files = {}
+        self.__class__._components_cache = None
         self._controller.arguments.groups = {}
         self._controller.load_settings()
 
     def _scroll_to_match(self):
-        self._listWidget.scrollToItem(self._listWidget.currentItem())
+        self._listView.scrollTo(self._listView.currentIndex())
 
-        index = self._listWidget.currentRow()
+        index = self._get_current_row()
         if index in self._best_matches:
             key = self._best_matches[index]
             settings_widget = self._widgets[index]
@@ -266,23 +511,42 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
             self._stackedLayout.currentWidget().ensureWidgetVisible(widget)
 
+    def _make_search_blob(self, component):
+        """
+        Create a lowercase string containing all the searchable text of the
+        given settings `component`.
+
+        The component name, its descriptive name and the key, value and help
+        text of each setting are separated by newlines, so that a filter text
+        only matches within one of these fields.
+        """
+
+        settings = self._controller.arguments.get_settings(component)
+        parts = [component, settings.name]
+        for key, info in settings.get_info():
+            parts.extend([key, str(info["value"]), info["help"]])
+
+        return "\n".join(parts).lower()
+
     def _filter(self, text):
-        text = text.toLower()
-        self._best_matches = {}
-        for i, component in enumerate(self._components):
-            if text == "":
-                hidden = False
-            elif self._match_component(i, component, text):
-                hidden = False
-            else:
-                hidden = True
+        self._proxyModel.setFilterFixedString(text)
 
-            self._listWidget.item(i).setHidden(hidden)
+        # Convert the text to a lowercase Python string once, so that matching 
+        # does not need to convert it for every setting.
+        text = unicode(text).lower()
+        self._best_matches = {}
+        if text != "":
+            # Only determine the best matches for the components that are 
+            # still visible after filtering.
+            for row in xrange(self._proxyModel.rowCount()):
+                proxy_index = self._proxyModel.index(row, 0)
+                i = self._proxyModel.mapToSource(proxy_index).row()
+                self._match_component(i, self._components[i], text)
 
         if len(self._best_matches) >= 1:
             keys = sorted(self._best_matches.keys())
-            if keys[0] != self._listWidget.currentRow():
-                self._listWidget.setCurrentRow(keys[0])
+            if keys[0] != self._get_current_row():
+                self._set_current_row(keys[0])
 
         self._scroll_to_match()
 
@@ -298,23 +562,35 @@ class Control_Panel_Settings_View(Control_Panel_View):
 
         bestMatch = (None, None)
         for key, info in settings.get_info():
-            matchType = self._match_setting(key, info, str(text))
+            matchType = self._match_setting(component, key, info, text)
             if matchType != Setting_Filter_Match.NONE:
                 if bestMatch[0] is None or matchType < bestMatch[0]:
                     bestMatch = (matchType, key)
 
+                # No other setting can have a better match than a key match.
+                if matchType == Setting_Filter_Match.KEY:
+                    break
+
         if bestMatch[0] is not None:
             self._best_matches[index] = bestMatch[1]
             return True
 
         return False
 
-    def _match_setting(self, key, info, text):
-        if text in key.lower():
+    def _match_setting(self, component, key, info, text):
+        # The key and help text do not change, so we only need to convert them 
+        # to lowercase once. The same key may occur in multiple components 
+        # with different help texts, so track them per component.
+        search_key = (component, key)
+        if search_key not in self._search_texts:
+            self._search_texts[search_key] = (key.lower(), info["help"].lower())
+
+        key_text, help_text = self._search_texts[search_key]
+        if text in key_text:
             return Setting_Filter_Match.KEY
         if text in str(info["value"]).lower():
             return Setting_Filter_Match.VALUE
-        if text in info["help"].lower():
+        if text in help_text:
             return Setting_Filter_Match.HELP
 
         return Setting_Filter_Match.NONE
@@ -62,8 +62,8 @@ class Import_Manager(object):
 
         import_module = self.load(module, relative_module=relative_module)
         try:
-            return import_module.__dict__[class_name]
-        except KeyError:
+            return getattr(import_module, class_name)
+        except AttributeError:
             raise ImportError("Cannot import class name '{}' from module '{}'".format(class_name, import_module.__name__))
 
     def unload(self, module, relative=True, store=True):
@@ -47,6 +47,16 @@ class USB_Manager(object):
             USB_Device_Category.CC2530: [],
             USB_Device_Category.CC2531: []
         }
+        self._indexed = False
+
+    @property
+    def indexed(self):
+        """
+        Whether the USB devices have been indexed since the USB manager was
+        created or cleared.
+        """
+
+        return self._indexed
 
     def index(self):
         """
@@ -61,6 +71,8 @@ class USB_Manager(object):
             fingerprint = [device["MAJOR"], device["MINOR"]]
             self._insert_device(device, fingerprint)
 
+        self._indexed = True
+
     def _insert_device(self, device, fingerprint):
         """
         Identify a `device` using its `fingerprint` and insert it into the
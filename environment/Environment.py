@@ -20,6 +20,10 @@ class Environment(Location_Proxy):
     # "Distance_Sensor_Simulator", depending on Environment type.
     _sensor_class = None
 
+    # A USB manager that is shared between environments created by `setup`
+    # without an explicit USB manager.
+    _usb_manager = None
+
     @classmethod
     def setup(cls, arguments, geometry_class=None, vehicle=None,
               thread_manager=None, usb_manager=None, simulated=None):
@@ -41,6 +45,11 @@ class Environment(Location_Proxy):
         support simulation, which might depend on vehicle-specific settings and
         external configuration. For more control over simulated environment
         setup, use the normal constructors instead, with fewer guarantees.
+
+        If no `usb_manager` is given, then a USB manager is created and indexed
+        only once, and shared by all environments that are set up without one.
+        If the shared USB manager has been cleared since, then it is indexed
+        again. A given `usb_manager` is indexed every time it is passed.
         """
 
         if geometry_class is None:
@@ -54,9 +63,15 @@ class Environment(Location_Proxy):
         geometry = geometry_type()
 
         if usb_manager is None:
-            usb_manager = USB_Manager()
-        
-        usb_manager.index()
+            if cls._usb_manager is None:
+                cls._usb_manager = USB_Manager()
+            if not cls._usb_manager.indexed:
+                cls._usb_manager.index()
+
+            usb_manager = cls._usb_manager
+        else:
+            usb_manager.index()
+
         if vehicle is None:
             thread_manager = Thread_Manager()
             vehicle = Vehicle.create(arguments, geometry, import_manager,
@@ -99,11 +114,9 @@ class Environment(Location_Proxy):
         # A lazily loaded list of distance sensors
         self._distance_sensors = None
 
-        # Servo pins of the flight controller for distance sensor rotation
-        self._servos = []
-        for servo in self.settings.get("servo_pins"):
-            pwm = servo["pwm"] if "pwm" in servo else None
-            self._servos.append(Servo(servo["pin"], servo["angles"], pwm))
+        # A lazily loaded list of servos for the servo pins of the flight 
+        # controller for distance sensor rotation
+        self._servos = None
 
         # Set up the RF sensor and packet callback handler for distributing 
         # ZigBee packets to certain receivers according to the specification.
@@ -127,12 +140,12 @@ class Environment(Location_Proxy):
         self._wait_waypoint_index = -1
         self.invalidate_measurement()
 
-        # Set up the infrared sensor for direct control of missions, etc.
+        # A lazily loaded infrared sensor for direct control of missions, etc. 
+        # Its settings are registered immediately, so that its arguments are 
+        # parsed and shown in the help before the sensor is created.
+        self._infrared_sensor = None
         if self.settings.get("infrared_sensor"):
-            from ..control.Infrared_Sensor import Infrared_Sensor
-            self._infrared_sensor = Infrared_Sensor(arguments, thread_manager)
-        else:
-            self._infrared_sensor = None
+            self.arguments.get_settings("infrared_sensor")
 
         # Set up vehicle attribute listeners to keep track of changes that 
         # affect the environment.
@@ -140,7 +153,7 @@ class Environment(Location_Proxy):
         self.vehicle.add_attribute_listener('servos', self.on_servos)
 
     def on_servos(self, vehicle, attribute, servo_pwms):
-        for servo in self._servos:
+        for servo in self.get_servos():
             pin = servo.get_pin()
             if pin in servo_pwms:
                 servo.set_current_pwm(servo_pwms[pin])
@@ -200,8 +213,16 @@ class Environment(Location_Proxy):
 
         If not empty, the first `Servo` elements of this list are reserved for
         rotating the same number of distance sensors, in the same order.
+
+        This method lazily initializes the servos.
         """
 
+        if self._servos is None:
+            self._servos = []
+            for servo in self.settings.get("servo_pins"):
+                pwm = servo["pwm"] if "pwm" in servo else None
+                self._servos.append(Servo(servo["pin"], servo["angles"], pwm))
+
         return self._servos
 
     def get_rf_sensor(self):
@@ -220,8 +241,15 @@ class Environment(Location_Proxy):
 
         This method returns `None` if the "infrared_sensor" setting is false
         during the Environment setup.
+
+        This method lazily initializes the infrared sensor.
         """
 
+        if self._infrared_sensor is None and self.settings.get("infrared_sensor"):
+            from ..control.Infrared_Sensor import Infrared_Sensor
+            self._infrared_sensor = Infrared_Sensor(self.arguments,
+                                                    self.thread_manager)
+
         return self._infrared_sensor
 
     def add_packet_action(self, action, callback):
@@ -433,8 +461,9 @@ class Environment(Location_Proxy):
         """
 
         yaw = self.get_yaw()
-        if id < len(self._servos):
-            yaw = yaw + self._servos[id].get_value() * math.pi/180
+        servos = self.get_servos()
+        if id < len(servos):
+            yaw = yaw + servos[id].get_value() * math.pi/180
 
         return yaw
 
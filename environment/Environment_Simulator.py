@@ -26,25 +26,35 @@ class Environment_Simulator(Environment):
         if scenefile is not None and self.settings.get("location_check"):
             self.set_location_check()
 
-        self._load_objects(scenefile, translation)
+        if scenefile is not None:
+            self._load_objects(scenefile, translation)
+        else:
+            # The hardcoded objects are only created once they are used, but 
+            # they are placed relative to the current location.
+            self.objects = None
+            self._objects_origin = self.get_location()
 
-    def _load_objects(self, scenefile=None, translation=None):
+    def _load_objects(self, scenefile=None, translation=None, origin=None):
         if scenefile is not None:
             loader = VRML_Loader(self, scenefile, translation)
             self.objects = loader.get_objects()
             return
 
-        # Use hardcoded objects for testing
-        l1 = self.get_location(100, 0, 10)
-        l2 = self.get_location(0, 100, 10)
-        l3 = self.get_location(-100, 0, 10)
-        l4 = self.get_location(0, -100, 10)
+        if origin is None:
+            origin = self.get_location()
 
         # Simplify function call
         get_location_meters = self.geometry.get_location_meters
+
+        # Use hardcoded objects for testing
+        l1 = get_location_meters(origin, 100, 0, 10)
+        l2 = get_location_meters(origin, 0, 100, 10)
+        l3 = get_location_meters(origin, -100, 0, 10)
+        l4 = get_location_meters(origin, 0, -100, 10)
+
         self.objects = [
             {
-                'center': get_location_meters(self.vehicle.location, 40, -10),
+                'center': get_location_meters(origin, 40, -10),
                 'radius': 2.5,
             },
             (get_location_meters(l1, 40, -40), get_location_meters(l1, 40, 40),
@@ -62,6 +72,9 @@ class Environment_Simulator(Environment):
         ]
 
     def get_objects(self):
+        if self.objects is None:
+            self._load_objects(origin=self._objects_origin)
+
         return self.objects
 
     def set_location_check(self):
@@ -77,7 +90,7 @@ class Environment_Simulator(Environment):
 
     def check_location(self, vehicle, attribute, new_location):
         if self.old_location is not None:
-            for obj in self.objects:
+            for obj in self.get_objects():
                 if isinstance(obj, list):
                     for face in obj:
                         factor = self.geometry.get_plane_intersection(face, self.old_location, new_location)[0]
@@ -73,31 +73,46 @@ class VRML_Loader(object):
                 self._parse_geometry(child.geometry, transform)
 
     def _parse_geometry(self, geometry, transform=None):
+        coord_index = np.asarray(geometry.coordIndex, dtype=int)
+        points = np.asarray(geometry.coord.point, dtype=float).reshape(-1, 3)
+
+        # Gather all referenced points at once, skipping the face separators.
+        points = points[coord_index[coord_index != -1]]
+        if transform is not None:
+            # The translation matrices from the VRML library are for affine 
+            # translations, but they are transposed for some reason. See 
+            # vrml.vrml97.transformmatrix, e.g. line 319. Multiplying the rows 
+            # of homogeneous points with the matrix applies the transposed 
+            # matrix to every point.
+            homogeneous = np.hstack([points, np.ones((len(points), 1))])
+            points = np.dot(homogeneous, transform)
+
+        # VRML geometry notation is in (x,z,y) where y is the vertical axis 
+        # (using GL notation here). We have to convert it to (z,x,y) since the 
+        # z/x are related to distances on the ground in north and east 
+        # directions, respectively, and y is still the altitude.
+        norths = points[:, 1] + self.translation[0]
+        easts = points[:, 0] - self.translation[1]
+        alts = points[:, 2] + self.translation[2]
+
+        # Convert the offsets relative to the current location only once, 
+        # rather than retrieving the vehicle location again for every point.
+        origin = self.environment.get_location()
+        get_location_meters = self.environment.geometry.get_location_meters
+
         faces = []
         face = []
-        for i in geometry.coordIndex:
+        point = 0
+        for i in coord_index:
             if i == -1:
                 faces.append(face)
                 face = []
             else:
-                point = geometry.coord.point[i]
-                if transform is not None:
-                    # The translation matrices from the VRML library are for 
-                    # affine translations, but they are transposed for some 
-                    # reason. See vrml.vrml97.transformmatrix, e.g. line 319.
-                    point = np.dot(transform.T, np.append(point, 1).T)
-
                 # Convert to Location
-                # VRML geometry notation is in (x,z,y) where y is the vertical 
-                # axis (using GL notation here). We have to convert it to 
-                # (z,x,y) since the z/x are related to distances on the ground 
-                # in north and east directions, respectively, and y is still 
-                # the altitude.
-                north = point[1] + self.translation[0]
-                east = point[0] - self.translation[1]
-                alt = point[2] + self.translation[2]
-                loc = self.environment.get_location(north, east, alt)
+                loc = get_location_meters(origin, norths[point], easts[point],
+                                          alts[point])
                 face.append(loc)
+                point += 1
 
         if len(face) > 0:
             faces.append(face)
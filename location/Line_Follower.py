@@ -99,6 +99,15 @@ class Line_Follower_Bit_Mask(IntEnum):
     INTERSECTION = 0b1001
 
 class Line_Follower(Threadable):
+    # Location offsets for moving to the next intersection in each direction, 
+    # indexed by `Line_Follower_Direction` value.
+    DIRECTION_DELTAS = (
+        (0, 1),  # UP
+        (1, 0),  # RIGHT
+        (0, -1), # DOWN
+        (-1, 0)  # LEFT
+    )
+
     def __init__(self, location, direction, callback, thread_manager, delay=0):
         """
         Initialize the line follower object. We assume that we are working
@@ -108,8 +117,9 @@ class Line_Follower(Threadable):
 
         super(Line_Follower, self).__init__("line_follower", thread_manager)
 
-        if not isinstance(location, tuple):
-            raise ValueError("Location must be a tuple")
+        if __debug__:
+            if not isinstance(location, tuple):
+                raise ValueError("Location must be a tuple")
 
         self._location = location
         self.set_direction(direction)
@@ -159,14 +169,15 @@ class Line_Follower(Threadable):
         sensor values from the line follower.
         """
 
-        if not isinstance(sensor_values, list) or len(sensor_values) != 4:
-            raise ValueError("Sensor values must be a list with four elements")
+        # Validation is left out when running optimized (`python -O`), since 
+        # this is called for every sensor reading.
+        if __debug__:
+            if not isinstance(sensor_values, list) or len(sensor_values) != 4:
+                raise ValueError("Sensor values must be a list with four elements")
 
         # Represent the state as an integer to allow for bit manipulations.
-        state = 0
-        for sensor_value in sensor_values:
-            state = state << 1
-            state += sensor_value
+        state = (sensor_values[0] << 3) | (sensor_values[1] << 2) | \
+                (sensor_values[2] << 1) | sensor_values[3]
 
         # Check if we are at a line or at an intersection and update the
         # state and location of the vehicle accordingly.
@@ -183,14 +194,8 @@ class Line_Follower(Threadable):
             self._state = Line_Follower_State.AT_INTERSECTION
 
             # Update the location using the direction.
-            if self._direction == Line_Follower_Direction.UP:
-                self._location = (self._location[0], self._location[1] + 1)
-            elif self._direction == Line_Follower_Direction.DOWN:
-                self._location = (self._location[0], self._location[1] - 1)
-            elif self._direction == Line_Follower_Direction.LEFT:
-                self._location = (self._location[0] - 1, self._location[1])
-            elif self._direction == Line_Follower_Direction.RIGHT:
-                self._location = (self._location[0] + 1, self._location[1])
+            dx, dy = self.DIRECTION_DELTAS[self._direction]
+            self._location = (self._location[0] + dx, self._location[1] + dy)
 
             # Notify the listener (callback) and pass the new location.
             self._callback("intersection", self._location)
@@ -213,8 +218,9 @@ class Line_Follower(Threadable):
         Set the state of the line follower.
         """
 
-        if not isinstance(state, int) or not 1 <= state <= 2:
-            raise ValueError("Direction must be one of the defined types")
+        if __debug__:
+            if not isinstance(state, int) or not 1 <= state <= 2:
+                raise ValueError("Direction must be one of the defined types")
 
         self._state = state
 
@@ -223,7 +229,8 @@ class Line_Follower(Threadable):
         Set the direction of the vehicle.
         """
 
-        if not isinstance(direction, int) or not 0 <= direction <= 3:
-            raise ValueError("Direction must be one of the defined types")
+        if __debug__:
+            if not isinstance(direction, int) or not 0 <= direction <= 3:
+                raise ValueError("Direction must be one of the defined types")
 
         self._direction = direction
@@ -1,4 +1,4 @@
-import Queue
+from collections import deque
 from ..zigbee.Packet import Packet
 
 class Buffer(object):
@@ -14,7 +14,9 @@ class Buffer(object):
         self._origin = (0, 0)
         self._size = (0, 0)
 
-        self._queue = Queue.Queue()
+        # A double-ended queue supports appending packets from a producer 
+        # thread and popping them from a consumer thread without locking.
+        self._queue = deque()
         self._calibration = {}
 
     def get(self):
@@ -22,27 +24,28 @@ class Buffer(object):
         Get a packet from the buffer (or None if the queue is empty).
         """
 
-        if self._queue.empty():
+        if not self._queue:
             return None
 
-        return self._queue.get()
+        return self._queue.popleft()
 
     def put(self, packet):
         """
         Put a packet into the buffer.
         """
 
-        if not isinstance(packet, Packet):
-            raise ValueError("The provided packet is not a `Packet` object.")
+        if __debug__:
+            if not isinstance(packet, Packet):
+                raise ValueError("The provided packet is not a `Packet` object.")
 
-        self._queue.put(packet)
+        self._queue.append(packet)
 
     def count(self):
         """
         Count the number of packets in the buffer.
         """
 
-        return self._queue.qsize()
+        return len(self._queue)
 
     @property
     def number_of_sensors(self):
@@ -65,10 +65,10 @@ class Dataset_Buffer(Buffer):
         and the calibrated RSSI value.
         """
 
-        if self._queue.empty():
+        if not self._queue:
             return None
 
-        packet = self._queue.get()
+        packet = self._queue.popleft()
 
         source = packet[0]
         destination = packet[1]
@@ -109,4 +109,4 @@ class Dataset_Buffer(Buffer):
         if not isinstance(packet, list) or len(packet) != 3:
             raise ValueError("The provided packet is not a valid list.")
 
-        self._queue.put(packet)
+        self._queue.append(packet)
@@ -52,10 +52,10 @@ class Dump_Buffer(Buffer):
         and the calibrated RSSI value.
         """
 
-        if self._queue.empty():
+        if not self._queue:
             return None
 
-        dump = self._queue.get()
+        dump = self._queue.popleft()
 
         packet = Packet()
         packet.set("specification", "rssi_ground_station")
@@ -85,4 +85,4 @@ class Dump_Buffer(Buffer):
         if not isinstance(packet, list) or len(packet) != 8:
             raise ValueError("The provided packet is not a valid list.")
 
-        self._queue.put(packet)
+        self._queue.append(packet)
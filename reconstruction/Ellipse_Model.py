@@ -39,5 +39,9 @@ class Ellipse_Model(Model):
         and destination sensor locations to each center of a pixel on the grid.
         """
 
-        weights = (source_distances + destination_distances < length + self._lambda)
-        return (1.0 / np.sqrt(length)) * weights
+        # Reuse the array of summed distances for the ellipse mask and the 
+        # weights to avoid allocating a boolean mask and another result array.
+        weights = source_distances + destination_distances
+        np.less(weights, length + self._lambda, out=weights)
+        weights *= 1.0 / np.sqrt(length)
+        return weights
@@ -2,6 +2,14 @@ import numpy as np
 from Reconstructor import Reconstructor
 
 class SVD_Reconstructor(Reconstructor):
+    # Relative cutoff for small singular values, equal to the default of 
+    # `np.linalg.pinv`.
+    RCOND = 1e-15
+
+    # Largest condition number of the weight matrix for which we apply the 
+    # pseudoinverse in single precision.
+    MAX_SINGLE_PRECISION_CONDITION = 1e3
+
     def __init__(self, arguments):
         """
         Initialize the SVD reconstructor object.
@@ -9,6 +17,11 @@ class SVD_Reconstructor(Reconstructor):
 
         super(SVD_Reconstructor, self).__init__(arguments)
 
+        # The weight matrix often stays the same for many executions, so we 
+        # keep a copy of it together with its pseudoinverse.
+        self._weight_matrix = None
+        self._pseudoinverse = None
+
     @property
     def type(self):
         """
@@ -30,6 +43,38 @@ class SVD_Reconstructor(Reconstructor):
 
         A = weight_matrix
         b = rssi
-        U, S, Vt = np.linalg.svd(A, full_matrices=False)
-        A_inv = np.dot(np.dot(Vt.T, np.diag(np.reciprocal(S))), U.T)
-        return np.dot(A_inv, b)
+        if self._weight_matrix is None or \
+           not np.array_equal(self._weight_matrix, A):
+            # Compute the pseudoinverse `V * S^-1 * U^T`. The weight matrix 
+            # object updates its matrix in place, so we store a copy of it.
+            U, S, Vt = np.linalg.svd(A, full_matrices=False)
+            self._weight_matrix = np.array(A)
+
+            # Like `np.linalg.pinv`, treat singular values that are negligible 
+            # compared to the largest one as zero. Weight matrices of links 
+            # that only cross the network horizontally and vertically are rank 
+            # deficient, and inverting these values would blow up the result.
+            cutoff = self.RCOND * np.max(S)
+            large = S > cutoff
+            S_inverse = np.zeros(S.shape)
+            S_inverse[large] = 1.0 / S[large]
+            pseudoinverse = np.dot(Vt.T * S_inverse, U.T)
+
+            # Signal strength measurements are quantized to whole decibels, so 
+            # single precision suffices for applying the pseudoinverse of a 
+            # well-conditioned weight matrix. The relative error is in the 
+            # order of the float32 machine epsilon times the condition number, 
+            # so we keep double precision for badly conditioned matrices.
+            condition = np.max(S) / np.min(S[large]) if large.any() else np.inf
+            if condition > self.MAX_SINGLE_PRECISION_CONDITION:
+                dtype = np.float64
+            else:
+                dtype = np.float32
+
+            self._pseudoinverse = np.ascontiguousarray(pseudoinverse,
+                                                       dtype=dtype)
+
+        # Callers always receive double precision intensities.
+        x = np.dot(self._pseudoinverse,
+                   np.asarray(b, dtype=self._pseudoinverse.dtype))
+        return x.astype(np.float64)
@@ -49,10 +49,10 @@ class Stream_Buffer(Buffer):
         value because there is no complete calibration yet.
         """
 
-        if self._queue.empty():
+        if not self._queue:
             return None
 
-        packet = self._queue.get()
+        packet = self._queue.popleft()
 
         if self._calibrate:
             # We are in calibration mode. There is no complete calibration yet,
@@ -3,7 +3,6 @@ import string
 import sys
 from argparse import ArgumentParser, HelpFormatter
 from copy import copy
-from functools import partial
 from enum import Enum
 from ..core.Import_Manager import Import_Manager
 from Settings import Settings
@@ -127,6 +126,10 @@ class Arguments(object):
         # Create the real argument parser.
         self.parser = self._create_parser(kwargs)
         self._import_manager = Import_Manager()
+        # Cache of choice keys and the objects they were retrieved from, by 
+        # their location. See `_get_choice_keys`.
+        self._choice_keys = {}
+        self._translators = {}
 
         # Create a positional arguments group that is used as a marker for the 
         # ArgumentsHelpFormatter to know where to insert them, namely as first 
@@ -144,6 +147,7 @@ class Arguments(object):
             self._positional_actions.append(fake_parser.add_argument(**kw))
 
         self.groups = {}
+        self._group_keys = {}
 
         self._done_help = False
 
@@ -250,7 +254,7 @@ class Arguments(object):
 
         if not self._done_help:
             self._add_arguments(group, settings)
-            self._fill_settings(settings)
+            self._fill_settings(group, settings)
 
     def load_choice_source(self, location, relative=True):
         """
@@ -283,6 +287,9 @@ class Arguments(object):
 
         Returns a list containing the enum values, the keys from the variable
         dictionary, or the symbol names from the module's exportable contents.
+        The list for an enum or module is cached for later lookups of the same
+        location as long as the same object is loaded from there, thus it must
+        not be altered by the caller.
         """
 
         try:
@@ -293,16 +300,27 @@ class Arguments(object):
             # then the error will be handled in a better way there.
             return None
 
-        if isinstance(data, type) and issubclass(data, Enum):
-            return [item.value for item in iter(data)]
-
+        # Dictionaries may change, so their keys are always retrieved again.
         if isinstance(data, dict):
             return data.keys()
 
-        if hasattr(data, "__all__"):
-            return data.__all__
+        # Only reuse the cached keys if the location still refers to the same 
+        # object, for example when a module has not been replaced.
+        cache_key = (tuple(location), relative)
+        if cache_key in self._choice_keys:
+            source, keys = self._choice_keys[cache_key]
+            if source is data:
+                return keys
+
+        if isinstance(data, type) and issubclass(data, Enum):
+            keys = [item.value for item in iter(data)]
+        elif hasattr(data, "__all__"):
+            keys = data.__all__
+        else:
+            keys = dir(data)
 
-        return dir(data)
+        self._choice_keys[cache_key] = (data, keys)
+        return keys
 
     def get_help(self, key, info):
         """
@@ -399,13 +417,10 @@ class Arguments(object):
             kw["choices"] = choices
 
         if "replace" in info:
-            # Create a translation table and bind a function that performs the 
-            # translation on input to the type of the argument.
-            # This ensures the translation is performed before other checks 
-            # (such as allowed choices) are done.
-            table = string.maketrans(*info["replace"])
-            kw["type"] = partial(lambda table, x: str(x).translate(table),
-                                 table)
+            # Use a function that performs the translation on input as the 
+            # type of the argument. This ensures the translation is performed 
+            # before other checks (such as allowed choices) are done.
+            kw["type"] = self._get_translator(info["replace"])
         elif info["type"] == "bool":
             # Create options for enabling the setting. The counterpart for 
             # disabling is handled in `_add_arguments`.
@@ -417,6 +432,25 @@ class Arguments(object):
 
         return kw
 
+    def _get_translator(self, replace):
+        """
+        Retrieve a function that translates the characters in its input
+        according to the `replace` pair of source and target characters.
+
+        The translation table and function are created once for each pair.
+        """
+
+        replace = tuple(replace)
+        if replace not in self._translators:
+            table = string.maketrans(*replace)
+
+            def translate(value):
+                return str(value).translate(table)
+
+            self._translators[replace] = translate
+
+        return self._translators[replace]
+
     def _add_arguments(self, group, settings):
         """
         Register argument specifications in the argument parser for the
@@ -424,7 +458,10 @@ class Arguments(object):
         """
 
         argument_group = self.parser.add_argument_group("{} ({})".format(settings.name, group))
+        group_keys = []
         for key, info in settings.get_info():
+            group_keys.append((key, info))
+
             # Create arguments dictionary for the argument parser.
             # Use current value of the setting, since it might have been 
             # overridden by the settings compared to the actual defaults.
@@ -443,6 +480,8 @@ class Arguments(object):
 
             sub_group.add_argument("--{}".format(opt), **kw)
 
+        self._group_keys[group] = group_keys
+
     def _type_cast(self, value, info):
         """
         Cast the given string `value` to the correct type according to
@@ -462,15 +501,16 @@ class Arguments(object):
 
         return value
 
-    def _fill_settings(self, settings):
+    def _fill_settings(self, group, settings):
         """
         Parse arguments from the input and pass any options related to the current Settings object to it.
         """
 
         args, self.argv = self.parser.parse_known_args(self.argv)
-        for key, info in settings.get_info():
+        for key, info in self._group_keys[group]:
+            value = getattr(args, key)
             try:
-                value = self._type_cast(args.__dict__[key], info)
+                value = self._type_cast(value, info)
                 settings.set(key, value)
             except ValueError as e:
                 # Display errors from setting the value as a usage message.
@@ -0,0 +1,67 @@
+from mock import MagicMock
+from ..control_panel.Control_Panel_Settings_View import Control_Panel_Settings_View
+from ..settings.Arguments import Arguments
+from settings import SettingsTestCase
+
+class TestControlPanelSettingsView(SettingsTestCase):
+    def setUp(self):
+        self.arguments = Arguments("settings.json", [])
+        self.settings = self.arguments.get_settings("control_panel_settings")
+
+        self.new_settings = {}
+        values = [42, 3.14159, "some_text_value", [1.5, 2.5, 3.5], True, None]
+        for i in range(30):
+            key = "setting_{:02d}".format(i)
+            self.new_settings[key] = values[i % len(values)]
+
+    def _create_view(self, rf_sensor_type):
+        rf_sensor = MagicMock(type=rf_sensor_type)
+        controller = MagicMock(arguments=self.arguments, rf_sensor=rf_sensor)
+        view = Control_Panel_Settings_View(controller, self.settings)
+        view._new_settings = self.new_settings
+        view._ordered_settings = sorted(self.new_settings.iteritems())
+        return view
+
+    def test_get_setting_batches(self):
+        for rf_sensor_type in ("rf_sensor_physical_xbee",
+                               "rf_sensor_physical_texas_instruments",
+                               "rf_sensor_simulator"):
+            view = self._create_view(rf_sensor_type)
+            rf_sensor_settings = self.arguments.get_settings(rf_sensor_type)
+            packet_length = rf_sensor_settings.get("packet_length")
+
+            batches = view._get_setting_batches()
+
+            # All settings are sent exactly once in the sorted order.
+            items = [item for batch in batches for item in batch]
+            self.assertEqual(items, sorted(self.new_settings.iteritems()))
+
+            # Multiple settings are combined, but the largest serialized 
+            # packet still fits within the packet length of the RF sensor.
+            self.assertLess(len(batches), len(self.new_settings))
+            sizes = [
+                len(view._make_add_setting_packet(0, 0, batch).serialize())
+                for batch in batches
+            ]
+            self.assertLessEqual(max(sizes), packet_length)
+
+    def test_make_add_setting_packet(self):
+        view = self._create_view("rf_sensor_physical_xbee")
+
+        # A single setting is sent with its key and value.
+        packet = view._make_add_setting_packet(2, 3, [("foo", 42)])
+        self.assertEqual(packet.get("specification"), "setting_add")
+        self.assertEqual(packet.get("key"), "foo")
+        self.assertEqual(packet.get("value"), 42)
+        self.assertEqual(packet.get("index"), 3)
+        self.assertEqual(packet.get("to_id"), 2)
+
+        # Multiple settings are sent in bulk from the given pairs.
+        batch = [("bar", "text"), ("foo", 42)]
+        packet = view._make_add_setting_packet(1, 0, batch)
+        self.assertEqual(packet.get("specification"), "setting_add_bulk")
+        self.assertEqual(packet.get("settings"), {"bar": "text", "foo": 42})
+        self.assertEqual(packet.get("index"), 0)
+        self.assertEqual(packet.get("to_id"), 1)
+
+        self.assertEqual(view._format_setting_batch(batch), "bar, foo")
@@ -142,9 +142,11 @@ class TestCoreUSBManager(USBManagerTestCase):
             USB_Device_Category.CC2530: [],
             USB_Device_Category.CC2531: []
         })
+        self.assertFalse(self.usb_manager.indexed)
 
     def test_index(self):
         self.usb_manager.index()
+        self.assertTrue(self.usb_manager.indexed)
 
         expected_index = {
             USB_Device_Category.XBEE: (self._xbee_port, USB_Device_Baud_Rate.XBEE),
@@ -209,6 +211,7 @@ class TestCoreUSBManager(USBManagerTestCase):
         self.usb_manager.index()
         devices = self.usb_manager._devices
         self.usb_manager.clear()
+        self.assertFalse(self.usb_manager.indexed)
 
         # The USB device storage must contain empty categories.
         self.assertEqual(self.usb_manager._devices, {
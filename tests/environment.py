@@ -4,7 +4,7 @@ from mock import patch, MagicMock, PropertyMock
 from ..bench.Method_Coverage import covers
 from ..core.Import_Manager import Import_Manager
 from ..core.Thread_Manager import Thread_Manager
-from ..core.USB_Manager import USB_Manager
+from ..core.USB_Manager import USB_Manager, USB_Device_Category
 from ..distance.Distance_Sensor_Simulator import Distance_Sensor_Simulator
 from ..environment.Environment import Environment
 from ..environment.Environment_Simulator import Environment_Simulator
@@ -95,6 +95,12 @@ class EnvironmentTestCase(LocationTestCase, SettingsTestCase,
         return self.environment.location_valid(request)[0]
 
     def tearDown(self):
+        # Do not leak the shared USB manager with its indexed virtual devices 
+        # into other tests.
+        if Environment._usb_manager is not None:
+            Environment._usb_manager.clear()
+            Environment._usb_manager = None
+
         super(EnvironmentTestCase, self).tearDown()
         if self._modules:
             self._module_patcher.stop()
@@ -125,6 +131,21 @@ class TestEnvironment(EnvironmentTestCase):
                                         simulated=self._simulated)
         self.assertIsInstance(environment.usb_manager, USB_Manager)
 
+        # Environments set up without a USB manager share the same one.
+        other_environment = Environment.setup(self.arguments,
+                                              simulated=self._simulated)
+        self.assertEqual(other_environment.usb_manager,
+                         environment.usb_manager)
+
+        # A shared USB manager that has been cleared is indexed again.
+        environment.usb_manager.clear()
+        other_environment = Environment.setup(self.arguments,
+                                              simulated=self._simulated)
+        self.assertEqual(other_environment.usb_manager,
+                         environment.usb_manager)
+        self.assertTrue(other_environment.usb_manager.indexed)
+        self.assertNotEqual(other_environment.usb_manager._devices[USB_Device_Category.XBEE], [])
+
         geometry = Geometry_Spherical()
         import_manager = Import_Manager()
         thread_manager = Thread_Manager()
@@ -143,6 +164,7 @@ class TestEnvironment(EnvironmentTestCase):
         self.assertEqual(environment.usb_manager, usb_manager)
         self.assertIsNone(environment.get_rf_sensor())
         self.assertEqual(environment._required_sensors, set())
+        self.assertIsNone(environment._servos)
         for servo in environment.get_servos():
             self.assertIsInstance(servo, Servo)
 
@@ -183,6 +205,10 @@ class TestEnvironment(EnvironmentTestCase):
         self.assertEqual(self.environment.usb_manager, self.usb_manager)
         self.assertEqual(self.environment.arguments, self.arguments)
         self.assertTrue(self.environment.settings.get("infrared_sensor"))
+        # The infrared sensor settings are registered before the sensor itself 
+        # is created.
+        self.assertIn("infrared_sensor", self.arguments.groups)
+        self.assertIsNone(self.environment._infrared_sensor)
 
     @covers([
         "get_vehicle", "get_arguments", "get_import_manager",
@@ -0,0 +1,111 @@
+import numpy as np
+from mock import patch
+from ..reconstruction.SVD_Reconstructor import SVD_Reconstructor
+from ..reconstruction.Weight_Matrix import Weight_Matrix
+from ..settings.Arguments import Arguments
+from settings import SettingsTestCase
+
+class TestReconstructionSVDReconstructor(SettingsTestCase):
+    def setUp(self):
+        self.arguments = Arguments("settings.json", [])
+        self.reconstructor = SVD_Reconstructor(self.arguments)
+
+        # Use a fixed weight matrix with more links than pixels and signal 
+        # strength measurements that are quantized to whole decibels.
+        self.links = 20
+        self.pixels = 16
+        self.random_state = np.random.RandomState(0)
+        self.weight_matrix = Weight_Matrix(self.arguments, [0, 0], [4, 4],
+                                           number_of_links=self.links)
+        self.weight_matrix._matrix = self.random_state.rand(self.links,
+                                                            self.pixels)
+        self.rssi = -self.random_state.randint(40, 80, size=self.links).astype(np.float64)
+
+    def assert_solution(self, actual, A, b):
+        expected = np.linalg.pinv(A).dot(b)
+
+        # The result is given in double precision, but the pseudoinverse is 
+        # applied in single precision, so the result matches the double 
+        # precision solution up to a relative tolerance of 1e-4.
+        self.assertEqual(actual.dtype, np.float64)
+        self.assertEqual(actual.shape, expected.shape)
+        tolerance = 1e-4 * np.max(np.abs(expected))
+        self.assertTrue(np.allclose(actual, expected, rtol=0, atol=tolerance))
+
+    def test_initialization(self):
+        self.assertIsNone(self.reconstructor._weight_matrix)
+        self.assertIsNone(self.reconstructor._pseudoinverse)
+
+    def test_type(self):
+        self.assertEqual(self.reconstructor.type,
+                         "reconstruction_svd_reconstructor")
+
+    def test_execute(self):
+        A = self.weight_matrix.output()
+        actual = self.reconstructor.execute(A, self.rssi)
+        self.assert_solution(actual, A, self.rssi)
+
+    def test_execute_unchanged(self):
+        A = self.weight_matrix.output()
+        with patch("numpy.linalg.svd", wraps=np.linalg.svd) as svd_mock:
+            first = self.reconstructor.execute(A, self.rssi)
+            self.assertEqual(svd_mock.call_count, 1)
+
+            # The decomposition is reused for an unchanged weight matrix, 
+            # even when the measurements change.
+            rssi = self.rssi - 1
+            second = self.reconstructor.execute(A, rssi)
+            self.assertEqual(svd_mock.call_count, 1)
+
+        self.assert_solution(first, A, self.rssi)
+        self.assert_solution(second, A, rssi)
+
+    def test_execute_mutated(self):
+        A = self.weight_matrix.output()
+        with patch("numpy.linalg.svd", wraps=np.linalg.svd) as svd_mock:
+            self.reconstructor.execute(A, self.rssi)
+            self.assertEqual(svd_mock.call_count, 1)
+
+            # The weight matrix updates its matrix in place, like it does for 
+            # prefilled rows, so the cached copy must detect this change.
+            A[0, :] = self.random_state.rand(self.pixels)
+            self.assertIs(self.weight_matrix.output(), A)
+
+            actual = self.reconstructor.execute(A, self.rssi)
+            self.assertEqual(svd_mock.call_count, 2)
+
+        self.assert_solution(actual, A, self.rssi)
+
+    def create_grid_weight_matrix(self, lines):
+        # Create a realistic weight matrix with links that cross the network 
+        # horizontally and vertically, like the sensors of a grid mission.
+        weight_matrix = Weight_Matrix(self.arguments, [0, 0], [4, 4])
+        for i in lines:
+            weight_matrix.update((0, i), (4, i))
+            weight_matrix.update((i, 0), (i, 4))
+
+        A = weight_matrix.output()
+        rssi = -self.random_state.randint(40, 80, size=A.shape[0]).astype(np.float64)
+        return A, rssi
+
+    def test_execute_rank_deficient(self):
+        # Links through the centers of the pixels result in a weight matrix 
+        # without full rank. Negligible singular values must be ignored like 
+        # in the pseudoinverse computed by NumPy.
+        A, rssi = self.create_grid_weight_matrix(range(0, 4))
+        self.assertLess(np.linalg.matrix_rank(A), A.shape[0])
+
+        actual = self.reconstructor.execute(A, rssi)
+        self.assertEqual(self.reconstructor._pseudoinverse.dtype, np.float32)
+        self.assert_solution(actual, A, rssi)
+
+    def test_execute_ill_conditioned(self):
+        # Links along the boundaries of the network result in a badly 
+        # conditioned weight matrix, so the pseudoinverse must be applied 
+        # in double precision.
+        A, rssi = self.create_grid_weight_matrix(range(0, 5))
+
+        actual = self.reconstructor.execute(A, rssi)
+        self.assertEqual(self.reconstructor._pseudoinverse.dtype, np.float64)
+        self.assertEqual(actual.dtype, np.float64)
+        self.assertTrue(np.allclose(actual, np.linalg.pinv(A).dot(rssi)))
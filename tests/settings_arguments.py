@@ -79,6 +79,15 @@ class TestSettingsArguments(SettingsTestCase):
         # Arguments left to parse that may be part of another component
         self.assertEqual(arguments.argv, ['--other'])
 
+    def test_get_settings_type_cast(self):
+        arguments = Arguments("tests/settings/settings.json", [],
+                              defaults_file=self.defaults_file)
+        settings = arguments.get_settings("child")
+        # Integer values for float settings are cast to floats, even though 
+        # the argument parser only converts string defaults.
+        self.assertIsInstance(settings.get("factor"), float)
+        self.assertEqual(settings.get("factor"), 3.0)
+
     def test_check_help(self):
         arguments = Arguments("tests/settings/settings.json", ['--help'],
                               defaults_file=self.defaults_file)
@@ -332,6 +341,44 @@ class TestSettingsArguments(SettingsTestCase):
             info = {"enum": ["enum_module", "MockEnum"]}
             self.assertEqual(arguments.get_choices(info), expected)
 
+    def test_get_choices_cache(self):
+        arguments = Arguments("tests/settings/settings.json", [],
+                              defaults_file=self.defaults_file)
+
+        package = __package__.split('.')[0]
+        mock_enum_module = MagicMock(MockEnum=MockEnum)
+        modules = {
+            package + ".enum_module": mock_enum_module
+        }
+        info = {"enum": ["enum_module", "MockEnum"]}
+        with patch.dict('sys.modules', modules):
+            self.assertEqual(arguments.get_choices(info), [1, 2])
+
+            # Choices from the same object at a location are cached.
+            keys = arguments._get_choice_keys(info["enum"])
+            self.assertIs(arguments._get_choice_keys(info["enum"]), keys)
+
+        # A different object at the same location does not receive the keys 
+        # from the cache.
+        mock_enum_module = MagicMock(MockEnum=Enum("MockEnum", "FOO BAR BAZ"))
+        modules = {
+            package + ".enum_module": mock_enum_module
+        }
+        with patch.dict('sys.modules', modules):
+            self.assertEqual(arguments.get_choices(info), [1, 2, 3])
+
+        # Dictionary keys are never cached, since the dictionary may change.
+        data = {'a': 'b'}
+        mock_module = MagicMock(mock_member=data)
+        modules = {
+            "mock_module": mock_module
+        }
+        info = {"keys": ["mock_module", "mock_member"]}
+        with patch.dict('sys.modules', modules):
+            self.assertEqual(arguments.get_choices(info), ['a'])
+            data['c'] = 'd'
+            self.assertEqual(sorted(arguments.get_choices(info)), ['a', 'c'])
+
     def test_load_choice_source(self):
         arguments = Arguments("tests/settings/settings.json", [],
                               defaults_file=self.defaults_file)
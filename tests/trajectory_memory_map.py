@@ -218,3 +218,23 @@ class TestTrajectoryMemoryMap(EnvironmentTestCase):
         # Test that a location that is outside the map does not raise an error.
         outside_location = memory_map.handle_sensor(1000, math.pi)
         self.assertFalse(memory_map.location_in_bounds(outside_location))
+
+    def test_handle_sensors(self):
+        size = 100
+        resolution = 5
+        altitude = 4.0
+
+        memory_map = Memory_Map(self.environment, size, resolution, altitude)
+        self.environment.get_vehicle().set_location(0.0, 0.0, altitude)
+
+        # Points outside the map do not raise an error and are not placed.
+        locations = memory_map.handle_sensors([1.0, 1.0, 1000],
+                                              [math.pi, 0.5*math.pi, math.pi])
+        self.assertEqual(len(locations), 3)
+        self.assertEqual(memory_map.get_index(locations[0]), (250, 245))
+        self.assertFalse(memory_map.location_in_bounds(locations[2]))
+
+        nonzero = memory_map.get_nonzero()
+        self.assertEqual(len(nonzero), 2)
+        self.assertIn((250, 245), nonzero)
+        self.assertIn(memory_map.get_index(locations[1]), nonzero)
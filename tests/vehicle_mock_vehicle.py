@@ -480,6 +480,59 @@ class TestVehicleMockVehicle(VehicleTestCase):
             self.assertEqual(self.vehicle.location.local_frame,
                              LocationLocal(2.0, 20.0, -10.0))
 
+    def test_handle_speed(self):
+        self.vehicle._speed = 2.0
+        geometry = self.vehicle._geometry
+        with patch.object(geometry, "bearing_to_angle",
+                          wraps=geometry.bearing_to_angle) as bearing_mock:
+            # Moving north.
+            self.vehicle._attitude._yaw = 0.0
+            vNorth, vEast, vAlt = self.vehicle._handle_speed()
+            self.assertAlmostEqual(vNorth, 2.0)
+            self.assertAlmostEqual(vEast, 0.0)
+            self.assertEqual(vAlt, 0.0)
+            self.assertEqual(bearing_mock.call_count, 1)
+
+            # The heading components are reused while the yaw stays the same.
+            self.vehicle._handle_speed()
+            self.assertEqual(bearing_mock.call_count, 1)
+
+            # The velocity follows a changed yaw, in this case moving east.
+            self.vehicle._attitude._yaw = math.pi/2
+            vNorth, vEast, vAlt = self.vehicle._handle_speed()
+            self.assertAlmostEqual(vNorth, 0.0)
+            self.assertAlmostEqual(vEast, 2.0)
+            self.assertEqual(bearing_mock.call_count, 2)
+
+            # Moving south with an altitude change over the given distance.
+            self.vehicle._attitude._yaw = math.pi
+            vNorth, vEast, vAlt = self.vehicle._handle_speed(dist=4.0, dAlt=1.0)
+            self.assertAlmostEqual(vNorth, -2.0)
+            self.assertAlmostEqual(vEast, 0.0)
+            self.assertEqual(vAlt, 0.5)
+            self.assertEqual(bearing_mock.call_count, 3)
+
+    def test_update_location_min_delta_time(self):
+        with patch("time.time", return_value=100.0) as time_mock:
+            self.vehicle.check_arming()
+            self.vehicle.armed = True
+            self.vehicle._takeoff = True
+            self.vehicle.velocity = [2.0, 0.0, 0.0]
+            self.vehicle._update_time = 100.0
+
+            # Updates that are requested in quick succession are skipped.
+            time_mock.return_value = 100.00005
+            self.assertEqual(self.vehicle.location.local_frame,
+                             LocationLocal(0.0, 0.0, 0.0))
+            self.assertEqual(self.vehicle._update_time, 100.0)
+
+            # The next update integrates the entire interval since the last 
+            # update that was not skipped.
+            time_mock.return_value = 101.0
+            self.assertEqual(self.vehicle.location.local_frame,
+                             LocationLocal(2.0, 0.0, 0.0))
+            self.assertEqual(self.vehicle._update_time, 101.0)
+
     def test_get_delta_time(self):
         self.vehicle._update_time = 1234567890.25
         with patch("time.time", return_value=1234567890.5):
@@ -61,6 +61,36 @@ class TestZigBeePacket(ZigBeePacketTestCase):
         self.packet.set("specification", "waypoint_add")
         self.assertFalse(self.packet._private)
 
+    def test_update(self):
+        # The given keys and values should be present in the contents.
+        self.packet.update({"foo": "bar", "baz": 42})
+        self.assertEqual(self.packet._contents["foo"], "bar")
+        self.assertEqual(self.packet._contents["baz"], 42)
+
+        # When a valid specification is given, the private property must be 
+        # updated.
+        self.packet.update({
+            "specification": "waypoint_add",
+            "latitude": 12.345678
+        })
+        self.assertEqual(self.packet._contents["specification"], "waypoint_add")
+        self.assertEqual(self.packet._contents["latitude"], 12.345678)
+        self.assertFalse(self.packet._private)
+
+    def test_clone(self):
+        self.packet.set("specification", "waypoint_add")
+        self.packet.set("latitude", 12.345678)
+
+        # The clone has the same contents and private property, but changing 
+        # it does not change the original packet.
+        clone = self.packet.clone()
+        self.assertIsInstance(clone, Packet)
+        self.assertEqual(clone.get_all(), self.packet.get_all())
+        self.assertEqual(clone._private, self.packet._private)
+
+        clone.set("latitude", 1.0)
+        self.assertEqual(self.packet.get("latitude"), 12.345678)
+
     def test_unset(self):
         # A given key should not be present in the contents.
         self.packet._contents["foo"] = "bar"
@@ -1,7 +1,7 @@
 # Core imports
-import Queue
 import thread
 import time
+from collections import deque
 
 # Library imports
 from mock import patch, MagicMock, PropertyMock
@@ -77,10 +77,10 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
         self.assertEqual(self.rf_sensor._connection, None)
         self.assertEqual(self.rf_sensor._buffer, None)
         self.assertIsInstance(self.rf_sensor._scheduler, TDMA_Scheduler)
-        self.assertIsInstance(self.rf_sensor._packets, Queue.Queue)
-        self.assertEqual(self.rf_sensor._packets.qsize(), 0)
-        self.assertIsInstance(self.rf_sensor._custom_packets, Queue.Queue)
-        self.assertEqual(self.rf_sensor._custom_packets.qsize(), 0)
+        self.assertIsInstance(self.rf_sensor._packets, deque)
+        self.assertEqual(len(self.rf_sensor._packets), 0)
+        self.assertIsInstance(self.rf_sensor._custom_packets, deque)
+        self.assertEqual(len(self.rf_sensor._custom_packets), 0)
 
         self.assertEqual(self.rf_sensor._joined, False)
         self.assertEqual(self.rf_sensor._activated, False)
@@ -155,7 +155,7 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
         # when the measurements start.
         self.rf_sensor.start()
         self.assertTrue(self.rf_sensor._started)
-        self.assertEqual(self.rf_sensor._packets.qsize(), 0)
+        self.assertEqual(len(self.rf_sensor._packets), 0)
         self.assertNotEqual(self.rf_sensor._scheduler.timestamp, 0.0)
 
     def test_stop(self):
@@ -188,13 +188,13 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
         self.packet.set("to_id", 2)
         self.rf_sensor.enqueue(self.packet)
 
-        self.assertEqual(self.rf_sensor._custom_packets.qsize(),
+        self.assertEqual(len(self.rf_sensor._custom_packets),
                          self.rf_sensor.number_of_sensors - 1)
         for to_id in xrange(1, self.rf_sensor.number_of_sensors + 1):
             if to_id == self.rf_sensor.id:
                 continue
 
-            item = self.rf_sensor._custom_packets.get()
+            item = self.rf_sensor._custom_packets.popleft()
             self.assertIsInstance(item["packet"], Packet)
             self.assertEqual(item["packet"].get_all(), {
                 "specification": "waypoint_clear",
@@ -202,17 +202,17 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
             })
             self.assertEqual(item["to"], to_id)
 
-        self.assertEqual(self.rf_sensor._custom_packets.qsize(), 0)
+        self.assertEqual(len(self.rf_sensor._custom_packets), 0)
 
         # Packets that do contain a destination must be enqueued directly.
         self.rf_sensor.enqueue(self.packet, to=2)
 
-        self.assertEqual(self.rf_sensor._custom_packets.qsize(), 1)
-        self.assertEqual(self.rf_sensor._custom_packets.get(), {
+        self.assertEqual(len(self.rf_sensor._custom_packets), 1)
+        self.assertEqual(self.rf_sensor._custom_packets.popleft(), {
             "packet": self.packet,
             "to": 2
         })
-        self.assertEqual(self.rf_sensor._custom_packets.qsize(), 0)
+        self.assertEqual(len(self.rf_sensor._custom_packets), 0)
 
     def test_discover(self):
         # Providing an invalid callback raises an exception.
@@ -296,7 +296,7 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
 
     @patch.object(RF_Sensor, "_send_tx_frame")
     def test_send(self, send_tx_frame_mock):
-        self.rf_sensor._packets.put(self.rf_sensor._create_rssi_broadcast_packet(2))
+        self.rf_sensor._packets.append(self.rf_sensor._create_rssi_broadcast_packet(2))
 
         # If the current time is inside an allocated slot, then packets
         # may be sent.
@@ -327,7 +327,7 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
             self.assertEqual(packet.get("specification"), "rssi_broadcast")
             self.assertEqual(to, 0)
 
-            self.assertEqual(self.rf_sensor._packets.qsize(), 0)
+            self.assertEqual(len(self.rf_sensor._packets), 0)
 
         send_tx_frame_mock.reset_mock()
 
@@ -353,7 +353,7 @@ class TestZigBeeRFSensor(ZigBeeRFSensorTestCase):
             self.assertEqual(packet.get("to_id"), 2)
             self.assertEqual(to, 2)
 
-            self.assertEqual(self.rf_sensor._custom_packets.qsize(), 0)
+            self.assertEqual(len(self.rf_sensor._custom_packets), 0)
 
     def test_send_tx_frame(self):
         # Having a closed connection raises an exception.
@@ -284,8 +284,8 @@ class TestZigBeeRFSensorPhysicalTexasInstruments(ZigBeeRFSensorTestCase, USBMana
         self.rf_sensor._process_rssi_broadcast_packet(packet, rssi=42)
 
         # A ground station packet must be put in the packet list.
-        self.assertEqual(self.rf_sensor._packets.qsize(), 1)
+        self.assertEqual(len(self.rf_sensor._packets), 1)
 
-        packet = self.rf_sensor._packets.get()
+        packet = self.rf_sensor._packets.popleft()
         self.assertEqual(packet.get("specification"), "rssi_ground_station")
         self.assertEqual(packet.get("rssi"), 42)
@@ -145,9 +145,9 @@ class TestZigBeeRFSensorSimulator(ZigBeeRFSensorTestCase):
         self.assertNotEqual(timestamp, self.rf_sensor._scheduler.timestamp)
 
         # A ground station packet must be put in the packet list.
-        self.assertEqual(self.rf_sensor._packets.qsize(), 1)
+        self.assertEqual(len(self.rf_sensor._packets), 1)
 
-        packet = self.rf_sensor._packets.get()
+        packet = self.rf_sensor._packets.popleft()
         self.assertEqual(packet.get("specification"), "rssi_ground_station")
         self.assertIsInstance(packet.get("rssi"), int)
 
@@ -26,6 +26,7 @@ class TestZigBeeSettingsReceiver(EnvironmentTestCase):
         self.assertEqual(self.settings_receiver._new_settings, {})
         self.assertIn("setting_clear", self.environment._packet_callbacks.keys())
         self.assertIn("setting_add", self.environment._packet_callbacks.keys())
+        self.assertIn("setting_add_bulk", self.environment._packet_callbacks.keys())
         self.assertIn("setting_done", self.environment._packet_callbacks.keys())
 
     @patch.object(RF_Sensor, "enqueue")
@@ -96,6 +97,44 @@ class TestZigBeeSettingsReceiver(EnvironmentTestCase):
         })
         self.assertEqual(self.settings_receiver._next_index, 1)
 
+    @patch.object(RF_Sensor, "enqueue")
+    def test_add_bulk(self, enqueue_mock):
+        packet = Packet()
+        packet.set("specification", "setting_add_bulk")
+        packet.set("index", 1)
+        packet.set("settings", {
+            "home_location": [1, 2],
+            "closeness": 0.0
+        })
+
+        # Packets not meant for the current RF sensor are ignored.
+        packet.set("to_id", self.rf_sensor.id + 42)
+
+        self.environment.receive_packet(packet)
+        self.assertEqual(self.settings_receiver._new_settings, {})
+        enqueue_mock.assert_not_called()
+
+        packet.set("to_id", self.rf_sensor.id)
+
+        self.environment.receive_packet(packet)
+
+        self.assertEqual(enqueue_mock.call_count, 1)
+        args, kwargs = enqueue_mock.call_args
+        self.assertEqual(len(args), 1)
+        self.assertIsInstance(args[0], Packet)
+        self.assertEqual(args[0].get_all(), {
+            "specification": "setting_ack",
+            "next_index": 2,
+            "sensor_id": self.rf_sensor.id
+        })
+        self.assertEqual(kwargs, {"to": 0})
+
+        self.assertEqual(self.settings_receiver._new_settings, {
+            "home_location": [1, 2],
+            "closeness": 0.0
+        })
+        self.assertEqual(self.settings_receiver._next_index, 2)
+
     @patch.object(RF_Sensor, "enqueue")
     @patch.object(Thread_Manager, "interrupt")
     def test_done(self, interrupt_mock, enqueue_mock):
@@ -251,3 +251,26 @@ class Memory_Map(object):
             pass
 
         return loc
+
+    def handle_sensors(self, sensor_distances, angles):
+        """
+        Add multiple detected object points to the map at once, given a sequence
+        of measured distances `sensor_distances` of distance sensors and their
+        corresponding current angles `angles`.
+
+        Points that fall outside of the map are not placed in the map.
+
+        Returns a list of the calculated locations of the detected points.
+        """
+
+        location = self.proxy.get_location()
+        locations = [
+            self.geometry.get_location_angle(location, sensor_distance, angle)
+            for sensor_distance, angle in zip(sensor_distances, angles)
+        ]
+
+        # Place all point locations in the memory map with one assignment.
+        indexes = [self.get_index(loc) for loc in locations]
+        self.set_multi([idx for idx in indexes if self.index_in_bounds(*idx)], 1)
+
+        return locations
@@ -56,16 +56,18 @@ class Monitor(object):
         if self._paused:
             return True
 
-        # Put our current location on the map for visualization. Of course, 
-        # this location is also "safe" since we are flying there.
-        vehicle_idx = self.memory_map.get_index(self.environment.get_location())
-        try:
-            self.memory_map.set(vehicle_idx, -1)
-        except KeyError:
+        # The plot shows our current location on top of the memory map, thus 
+        # we only need to check whether we are still inside the map.
+        if not self.memory_map.location_in_bounds(self.environment.get_location()):
             print('Warning: Outside of memory map')
 
         self.mission.step()
 
+        # Collect the relevant measurements of all sensors so that the memory 
+        # map can place the detected points at once.
+        sensor_distances = []
+        yaws = []
+
         i = 0
         for sensor in self.sensors:
             yaw = sensor.get_angle()
@@ -73,9 +75,8 @@ class Monitor(object):
             sensor_distance = sensor.get_distance()
 
             if self.mission.check_sensor_distance(sensor_distance, yaw, pitch):
-                location = self.memory_map.handle_sensor(sensor_distance, yaw)
-                if add_point is not None:
-                    add_point(location)
+                sensor_distances.append(sensor_distance)
+                yaws.append(yaw)
                 if self.plot:
                     # Display the edge of the simulated object that is 
                     # responsible for the measured distance, and consequently 
@@ -88,6 +89,12 @@ class Monitor(object):
 
             i = i + 1
 
+        if sensor_distances:
+            locations = self.memory_map.handle_sensors(sensor_distances, yaws)
+            if add_point is not None:
+                for location in locations:
+                    add_point(location)
+
         # Display the current memory map interactively.
         if self.plot:
             self.plot.plot_lines(self.mission.get_waypoints())
@@ -96,13 +103,6 @@ class Monitor(object):
         if not self.mission.check_waypoint():
             return False
 
-        # Remove the vehicle from the current location. We set it to "safe" 
-        # since there is no object here.
-        try:
-            self.memory_map.set(vehicle_idx, 0)
-        except KeyError:
-            pass
-
         return True
 
     def sleep(self):
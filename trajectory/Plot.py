@@ -1,5 +1,4 @@
 import math
-import sys
 import numpy as np
 import matplotlib
 import matplotlib.pyplot as plt
@@ -52,28 +51,67 @@ class Plot(object):
         self.plt = plt
         self.fig, self.ax = self.plt.subplots()
 
+        # Create the objects and memory map image only once, and update the 
+        # image data when displaying instead of rebuilding the axes.
+        if self.plot_polygons is not None:
+            self.ax.add_collection(self.plot_polygons)
+
+        self.image = self.ax.imshow(self.memory_map.get_map(), origin='lower')
+
+        # Mark the current location of the vehicle on top of the memory map 
+        # rather than changing the map itself.
+        self.vehicle_point = self.ax.plot([], [], 'wo', markersize=6)[0]
+
         # Set up interactive drawing of the memory map. This makes the 
         # dronekit/mavproxy fairly annoyed since it creates additional 
         # threads/windows. One might have to press Ctrl-C and normal keys to 
         # make the program stop.
         self.plt.gca().set_aspect("equal", adjustable="box")
+        self._background = None
         if self.interactive:
+            # Only the changing artists are redrawn on top of a cached 
+            # background of the axes, which is captured after each full draw.
+            self.image.set_animated(True)
+            self.vehicle_point.set_animated(True)
+            if self.plot_polygons is not None:
+                self.plot_polygons.set_animated(True)
+
+            self.fig.canvas.mpl_connect("draw_event", self._store_background)
+
             self.plt.ion()
             self.plt.show()
+            self.fig.canvas.draw()
+
+    def _store_background(self, event=None):
+        self._background = self.fig.canvas.copy_from_bbox(self.ax.bbox)
 
     def get_plot(self):
         return self.plt
 
     def display(self):
-        if self.plot_polygons is not None:
-            self.ax.add_collection(self.plot_polygons)
-
         self._plot_vehicle_angle()
 
-        self.plt.imshow(self.memory_map.get_map(), origin='lower')
+        self.image.set_data(self.memory_map.get_map())
+        self.image.autoscale()
         if self.interactive:
-            self.plt.pause(sys.float_info.epsilon)
-            self.plt.cla()
+            canvas = self.fig.canvas
+            if self._background is not None:
+                canvas.restore_region(self._background)
+
+            self.ax.draw_artist(self.image)
+            if self.plot_polygons is not None:
+                self.ax.draw_artist(self.plot_polygons)
+
+            self.ax.draw_artist(self.vehicle_point)
+
+            # Draw the arrows and edges that were annotated for this step and 
+            # remove them afterward.
+            for text in list(self.ax.texts):
+                self.ax.draw_artist(text)
+                text.remove()
+
+            canvas.blit(self.ax.bbox)
+            canvas.flush_events()
         else:
             self.plt.show()
 
@@ -86,6 +124,8 @@ class Plot(object):
 
     def _plot_vehicle_angle(self):
         vehicle_idx = self.memory_map.get_xy_index(self.environment.get_location())
+        self.vehicle_point.set_data([vehicle_idx[0]], [vehicle_idx[1]])
+
         angle = self.environment.get_angle()
         arrow_length = 10.0
         if angle == 0.5*math.pi:
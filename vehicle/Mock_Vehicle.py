@@ -134,6 +134,10 @@ class Mock_Vehicle(MAVLink_Vehicle):
 
         # The last time the vehicle location was updated.
         self._update_time = time.time()
+        # The minimum number of seconds between two location updates. Updates 
+        # requested in quick succession, for example by reading multiple 
+        # properties, are skipped until this much time has passed.
+        self._min_delta_time = 1e-4
 
         # The current (updated-on-request) attitude of the vehicle.
         self._attitude = MockAttitude(0.0, 0.0, 0.0, self)
@@ -144,6 +148,9 @@ class Mock_Vehicle(MAVLink_Vehicle):
         # The direction in which the yaw should change.
         # 1 = clockwise, -1 = counterclockwise.
         self._yaw_direction = 1
+        # The yaw for which the heading components were last calculated, and 
+        # the north and east components of the heading for that yaw.
+        self._heading = None
 
         # The requested speed of the vehicle relative to current heading.
         # Overrides the requested velocity if set.
@@ -157,6 +164,12 @@ class Mock_Vehicle(MAVLink_Vehicle):
         self.gps_0 = GPSInfo(0.0, 0.0, 3, 0)
 
         self._commands = CommandSequence(self)
+        # Handlers for the supported command types in the commands sequence.
+        self._command_handlers = {
+            MAV_CMD_NAV_WAYPOINT: self._handle_waypoint_command,
+            MAV_CMD_NAV_LOITER_UNLIM: self._handle_loiter_command,
+            MAV_CMD_NAV_TAKEOFF: self._handle_takeoff_command
+        }
         self.parameters = {}
 
         self._home_location = LocationGlobal(0.0, 0.0, 0.0)
@@ -182,17 +195,23 @@ class Mock_Vehicle(MAVLink_Vehicle):
             self.commands._next = self.commands._next + 1
             return
 
-        if cmd.command == MAV_CMD_NAV_WAYPOINT:
-            self.set_target_location(lat=cmd.x, lon=cmd.y, alt=cmd.z)
-        elif cmd.command == MAV_CMD_NAV_LOITER_UNLIM:
-            # Set target location to False so we can detect this case in 
-            # update_location.
-            self._target_location = False
-        elif cmd.command == MAV_CMD_NAV_TAKEOFF:
-            if self._takeoff:
-                self.commands._next = self.commands._next + 1
-            else:
-                self.set_target_location(alt=cmd.z, takeoff=True)
+        handler = self._command_handlers.get(cmd.command)
+        if handler is not None:
+            handler(cmd)
+
+    def _handle_waypoint_command(self, cmd):
+        self.set_target_location(lat=cmd.x, lon=cmd.y, alt=cmd.z)
+
+    def _handle_loiter_command(self, cmd):
+        # Set target location to False so we can detect this case in 
+        # update_location.
+        self._target_location = False
+
+    def _handle_takeoff_command(self, cmd):
+        if self._takeoff:
+            self.commands._next = self.commands._next + 1
+        else:
+            self.set_target_location(alt=cmd.z, takeoff=True)
 
     def set_target_attitude(self, pitch=None, yaw=None, roll=None,
                             yaw_direction=0):
@@ -321,9 +340,15 @@ class Mock_Vehicle(MAVLink_Vehicle):
         return False
 
     def _handle_speed(self, dist=0.0, dAlt=0.0):
-        a = self._geometry.bearing_to_angle(self._attitude._yaw)
-        vNorth = math.sin(a) * self._speed
-        vEast = math.cos(a) * self._speed
+        # The yaw stays the same while moving towards a target location, so 
+        # only calculate the heading components again when it changes.
+        yaw = self._attitude._yaw
+        if self._heading is None or self._heading[0] != yaw:
+            a = self._geometry.bearing_to_angle(yaw)
+            self._heading = (yaw, math.sin(a), math.cos(a))
+
+        vNorth = self._heading[1] * self._speed
+        vEast = self._heading[2] * self._speed
         if dist != 0.0 and dAlt != 0.0:
             vAlt = dAlt / (dist/self._speed)
         else:
@@ -399,6 +424,8 @@ class Mock_Vehicle(MAVLink_Vehicle):
             return
 
         diff, new_time = self._get_delta_time()
+        if diff < self._min_delta_time:
+            return
 
         # m/s
         vNorth = 0.0
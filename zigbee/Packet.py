@@ -3,10 +3,22 @@ import struct
 import zlib
 
 class Packet(object):
+    # Packets are created in large numbers, so they only have slots for their 
+    # own state instead of an instance dictionary.
+    __slots__ = ("_private", "_contents")
+
     # Packet type specifications loaded from the JSON file.
     # The specifications are cached between packets.
     _specifications = None
 
+    # Formats for object types that can be packed directly.
+    _object_types = {
+        bool: "?",
+        int: "i",
+        float: "d",
+        str: "$"
+    }
+
     def __init__(self):
         """
         Initialize the packet with an empty contents key-value store.
@@ -14,18 +26,12 @@ class Packet(object):
         for all available packet types are listed in the settings JSON file.
         """
 
-        if self._specifications is None:
+        if Packet._specifications is None:
             with open("zigbee/specifications.json") as specifications_file:
-                self._specifications = json.load(specifications_file)
+                Packet._specifications = json.load(specifications_file)
 
         self._private = True
         self._contents = {}
-        self._object_types = {
-            bool: "?",
-            int: "i",
-            float: "d",
-            str: "$"
-        }
 
     def set(self, key, value):
         """
@@ -37,6 +43,31 @@ class Packet(object):
             specification = self._specifications[value]
             self._private = specification[0]["private"]
 
+    def update(self, contents):
+        """
+        Set multiple keys and values from the dictionary `contents` in the
+        contents key-value store at once.
+        """
+
+        self._contents.update(contents)
+        if "specification" in contents:
+            self.set("specification", contents["specification"])
+
+    def clone(self):
+        """
+        Create a copy of the packet with its own contents key-value store.
+
+        The values themselves are shared with the original packet, which is
+        sufficient since the fields of a packet are replaced rather than
+        altered in place.
+        """
+
+        packet = Packet()
+        packet._contents = self._contents.copy()
+        packet._private = self._private
+
+        return packet
+
     def unset(self, key):
         """
         Unset a key in the contents key-value store.
@@ -95,14 +126,16 @@ class Packet(object):
         if specification_name != "rssi_ground_station":
             raise ValueError("Dumps can only be imported for RSSI ground station packets")
 
-        self.set("sensor_id", dump[0])
-        self.set("from_latitude", dump[1])
-        self.set("from_longitude", dump[2])
-        self.set("from_valid", dump[3])
-        self.set("to_latitude", dump[4])
-        self.set("to_longitude", dump[5])
-        self.set("to_valid", dump[6])
-        self.set("rssi", dump[7])
+        self.update({
+            "sensor_id": dump[0],
+            "from_latitude": dump[1],
+            "from_longitude": dump[2],
+            "from_valid": dump[3],
+            "to_latitude": dump[4],
+            "to_longitude": dump[5],
+            "to_valid": dump[6],
+            "rssi": dump[7]
+        })
 
     def serialize(self):
         """
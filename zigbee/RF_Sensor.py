@@ -1,8 +1,7 @@
 # Core imports
-import copy
-import Queue
 import thread
 import time
+from collections import deque
 
 # Package imports
 from ..core.Threadable import Threadable
@@ -131,8 +130,10 @@ class RF_Sensor(Threadable):
         self._connection = None
         self._buffer = None
         self._scheduler = TDMA_Scheduler(self._id, arguments)
-        self._packets = Queue.Queue()
-        self._custom_packets = Queue.Queue()
+        # Packets are appended by the receiving thread and popped by the 
+        # sending loop, which a double-ended queue supports without locking.
+        self._packets = deque()
+        self._custom_packets = deque()
 
         self._joined = False
         self._activated = False
@@ -243,7 +244,7 @@ class RF_Sensor(Threadable):
         """
 
         self._scheduler.update()
-        self._packets = Queue.Queue()
+        self._packets = deque()
         self._started = True
 
     def stop(self):
@@ -275,12 +276,12 @@ class RF_Sensor(Threadable):
                 if to_id == self._id:
                     continue
 
-                self._custom_packets.put({
-                    "packet": copy.deepcopy(packet),
+                self._custom_packets.append({
+                    "packet": packet.clone(),
                     "to": to_id
                 })
         else:
-            self._custom_packets.put({
+            self._custom_packets.append({
                 "packet": packet,
                 "to": to
             })
@@ -362,8 +363,8 @@ class RF_Sensor(Threadable):
             self._send_tx_frame(packet, to_id)
 
         # Send collected packets to the ground station.
-        while not self._packets.empty() and self._scheduler.in_slot:
-            packet = self._packets.get()
+        while self._packets and self._scheduler.in_slot:
+            packet = self._packets.popleft()
             self._send_tx_frame(packet, 0)
 
     def _send_custom_packets(self):
@@ -371,8 +372,8 @@ class RF_Sensor(Threadable):
         Send custom packets to their destinations.
         """
 
-        while not self._custom_packets.empty():
-            item = self._custom_packets.get()
+        while self._custom_packets:
+            item = self._custom_packets.popleft()
             self._send_tx_frame(item["packet"], item["to"])
 
     def _send_tx_frame(self, packet, to=None):
@@ -409,14 +410,16 @@ class RF_Sensor(Threadable):
         valid, valid_pair = self._valid_callback(request)
 
         packet = Packet()
-        packet.set("specification", "rssi_broadcast")
-        packet.set("latitude", location[0])
-        packet.set("longitude", location[1])
-        packet.set("valid", valid)
-        packet.set("valid_pair", valid_pair)
-        packet.set("waypoint_index", waypoint_index)
-        packet.set("sensor_id", self._id)
-        packet.set("timestamp", time.time())
+        packet.update({
+            "specification": "rssi_broadcast",
+            "latitude": location[0],
+            "longitude": location[1],
+            "valid": valid,
+            "valid_pair": valid_pair,
+            "waypoint_index": waypoint_index,
+            "sensor_id": self._id,
+            "timestamp": time.time()
+        })
 
         return packet
 
@@ -447,13 +450,15 @@ class RF_Sensor(Threadable):
         to_valid = self._valid_callback(request)[0]
 
         packet = Packet()
-        packet.set("specification", "rssi_ground_station")
-        packet.set("sensor_id", self._id)
-        packet.set("from_latitude", rssi_broadcast_packet.get("latitude"))
-        packet.set("from_longitude", rssi_broadcast_packet.get("longitude"))
-        packet.set("from_valid", from_valid)
-        packet.set("to_latitude", location[0])
-        packet.set("to_longitude", location[1])
-        packet.set("to_valid", to_valid)
+        packet.update({
+            "specification": "rssi_ground_station",
+            "sensor_id": self._id,
+            "from_latitude": rssi_broadcast_packet.get("latitude"),
+            "from_longitude": rssi_broadcast_packet.get("longitude"),
+            "from_valid": from_valid,
+            "to_latitude": location[0],
+            "to_longitude": location[1],
+            "to_valid": to_valid
+        })
 
         return packet
@@ -17,6 +17,7 @@ class Settings_Receiver(object):
 
         self._environment.add_packet_action("setting_clear", self._clear)
         self._environment.add_packet_action("setting_add", self._add)
+        self._environment.add_packet_action("setting_add_bulk", self._add_bulk)
         self._environment.add_packet_action("setting_done", self._done)
 
     def _cleanup(self):
@@ -55,13 +56,29 @@ class Settings_Receiver(object):
         self._next_index = index + 1
         self._send_ack()
 
+    def _add_bulk(self, packet):
+        # Ignore packets that are not meant for us.
+        if packet.get("to_id") != self._rf_sensor.id:
+            return
+
+        index = packet.get("index")
+        settings = packet.get("settings")
+
+        self._new_settings.update(settings)
+
+        self._next_index = index + 1
+        self._send_ack()
+
     def _done(self, packet):
         # Ignore packets that are not meant for us.
         if packet.get("to_id") != self._rf_sensor.id:
             return
 
+        # Serialize the settings before writing them, since `json.dump` writes 
+        # every small chunk of indented output separately.
+        data = json.dumps(self._new_settings, indent=4, sort_keys=True)
         with open(self._arguments.settings_file, 'w') as settings_file:
-            json.dump(self._new_settings, settings_file, indent=4, sort_keys=True)
+            settings_file.write(data)
 
         self._next_index += 1
         self._send_ack()